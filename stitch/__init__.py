@@ -19,6 +19,7 @@ from .process import (
     compute_required_years,
     extract_unique_geoids,
     process_multiple_lags_batch,
+    process_multiple_lags_fused,
     process_multiple_lags_parallel,
 )
 
@@ -40,5 +41,6 @@ __all__ = [
     "compute_required_years",
     "extract_unique_geoids",
     "process_multiple_lags_batch",
+    "process_multiple_lags_fused",
     "process_multiple_lags_parallel",
 ]
@@ -542,6 +542,24 @@ class DailyMeasureDataDir:
         # Cache for loaded DailyMeasureData objects
         self._cache: Dict[str, DailyMeasureData] = {}
 
+    # ------------------------------------------------------------------
+    @property
+    def geoid_filter(self) -> Optional[set]:
+        """
+        GEOIDs kept when a year is loaded (None keeps all).
+
+        Cached years were filtered with the previous value, so assigning a
+        different filter clears the cache; re-assigning the same one keeps it.
+        This makes an instance safe to share between runs with different GEOIDs.
+        """
+        return self._geoid_filter
+
+    @geoid_filter.setter
+    def geoid_filter(self, geoid_filter: Optional[set]) -> None:
+        if geoid_filter != getattr(self, "_geoid_filter", None):
+            self._cache = {}
+        self._geoid_filter = geoid_filter
+
     # ------------------------------------------------------------------
     def _build_year_file_map(self) -> Dict[str, Path]:
         mapping = {}
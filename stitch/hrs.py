@@ -1,12 +1,119 @@
 from __future__ import annotations
+import copy
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
 from .daily_measure import DailyMeasureDataDir
-from .io_utils import read_data, write_data
+from .io_utils import get_file_format, read_data, write_data
+
+
+def _load_data(filename: Path, chunksize: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load a data file, optionally reading CSV/Stata files in chunks.
+
+    The chunks are concatenated into a single DataFrame, so peak memory still
+    holds the whole file (briefly twice while concatenating); chunking only
+    limits how much the parser decodes per call. Other formats ignore
+    `chunksize` and are read in one pass.
+    """
+    if chunksize is None or get_file_format(filename) not in ("csv", "stata"):
+        return read_data(filename)
+
+    with read_data(filename, chunksize=chunksize) as reader:
+        return pd.concat(reader, ignore_index=True)
+
+
+# Queries handled per tile in _lookup_move_index; a tile's int64 temporaries
+# (a few arrays of this length) fit comfortably in a typical L2 cache
+LOOKUP_BLOCK_SIZE = 16_384
+
+
+def _downcast_ids(ids: np.ndarray) -> np.ndarray:
+    """
+    Return int64 lookup IDs as int32 when every value fits.
+
+    Halves the bytes touched by the binary searches over person IDs; IDs
+    outside the int32 range are returned unchanged. Only used inside lookups,
+    so ID columns handed to callers keep their Int64 dtype.
+    """
+    info = np.iinfo(np.int32)
+    if len(ids) == 0 or (ids.min() >= info.min and ids.max() <= info.max):
+        return ids.astype(np.int32)
+    return ids
+
+
+def _zfill_geoids(geoids: pd.Series) -> pd.Series:
+    """
+    Format static GEOIDs as 11-character zero-padded strings.
+
+    Equivalent to ``geoids.astype(str).str.zfill(11)``, but each distinct
+    GEOID is formatted once and the result gathered back by position.
+    Factorizing merges None and NaN, so missing values are formatted per row.
+    """
+    codes, uniques = pd.factorize(geoids, use_na_sentinel=False)
+    padded = pd.Index(uniques).astype(str).str.zfill(11)
+    result = pd.Series(padded.take(codes), index=geoids.index, name=geoids.name)
+    missing = geoids.isna()
+    if missing.any():
+        result[missing] = geoids[missing].astype(str).str.zfill(11)
+    return result
+
+
+def _lookup_move_index(
+    hist_keys: np.ndarray,
+    block_starts: np.ndarray,
+    query_rank: np.ndarray,
+    query_days: np.ndarray,
+) -> np.ndarray:
+    """
+    Locate the residence active on each query date with binary searches.
+
+    Parameters
+    ----------
+    hist_keys : np.ndarray
+        int64 keys ``(person_rank << 32) | (day + 2**31)`` of every recorded
+        move, sorted ascending (i.e., by person, then move date).
+    block_starts : np.ndarray
+        Offset of each person's first move in `hist_keys`, with a trailing
+        ``len(hist_keys)`` sentinel.
+    query_rank : np.ndarray
+        Person rank of each query, or -1 for persons without history.
+    query_days : np.ndarray
+        Query dates as ``datetime64[D]``; NaT resolves to the last move.
+
+    Returns
+    -------
+    np.ndarray
+        Position in `hist_keys` of the latest move on or before each query
+        date, or -1 if the person is unknown or the date precedes their first
+        recorded move.
+    """
+    # Work through the queries in cache-sized tiles. Within a tile the keys are
+    # searched in sorted order, so successive binary searches walk `hist_keys`
+    # monotonically and reuse the cache lines the previous search touched.
+    if len(block_starts) <= 1:
+        # No parsed persons: every query is unknown
+        return np.full(len(query_rank), -1, dtype=np.int64)
+
+    out = np.empty(len(query_rank), dtype=np.int64)
+    for start in range(0, len(query_rank), LOOKUP_BLOCK_SIZE):
+        block = slice(start, start + LOOKUP_BLOCK_SIZE)
+        known = query_rank[block] >= 0
+        rank = np.where(known, query_rank[block], 0).astype(np.int64)
+        missing_day = np.isnat(query_days[block])
+        days = np.where(missing_day, 0, query_days[block].view(np.int64))
+
+        query_keys = (rank << 32) | (days + 2**31)
+        order = np.argsort(query_keys)
+        pos = np.empty(len(order), dtype=np.int64)
+        pos[order] = np.searchsorted(hist_keys, query_keys[order], side="right") - 1
+        pos = np.where(missing_day, block_starts[rank + 1] - 1, pos)
+        out[block] = np.where(known & (pos >= block_starts[rank]), pos, -1)
+    return out
 
 
 # ---------------------------------------------------------------------
@@ -29,6 +136,7 @@ class ResidentialHistoryHRS:
         geoid: str = "LINKCEN2010",
         survey_yr_col: str = "year",
         first_tract_mark: float = 999.0,
+        chunksize: Optional[int] = None,
     ):
         self.filename = Path(filename)
         self.hhidpn = hhidpn
@@ -41,13 +149,14 @@ class ResidentialHistoryHRS:
         self.first_tract_mark = first_tract_mark
 
         # Load only once (file read can be expensive)
-        self.df = read_data(self.filename)
+        self.df = _load_data(self.filename, chunksize)
         # Normalize identifier type to integer (nullable) for consistent keying
         if self.hhidpn in self.df.columns:
             self.df[self.hhidpn] = pd.to_numeric(
                 self.df[self.hhidpn], errors="coerce"
             ).astype("Int64")
         self._move_info = self._parse_move_info()
+        self._sort_move_history()
 
     def _parse_move_info(self) -> Dict[int, tuple[list[pd.Timestamp], list[str]]]:
         """
@@ -99,6 +208,36 @@ class ResidentialHistoryHRS:
         print("Residential history parsed! Debug: {}".format(debug))
         return move_info
 
+    def _sort_move_history(self) -> None:
+        """
+        Sort the parsed move history by (person, move date) once, at load time.
+
+        Stores the sorted person IDs, each person's block offset (with a
+        trailing sentinel), packed move keys and GEOIDs as arrays so every
+        lookup is a binary search; see `_lookup_move_index` for the layout.
+        """
+        self._move_ids = _downcast_ids(
+            np.array(sorted(self._move_info), dtype=np.int64)
+        )
+        counts = np.array(
+            [len(self._move_info[pid][0]) for pid in self._move_ids], dtype=np.int64
+        )
+        self._move_starts = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+        dates, geoids = [], []
+        for pid in self._move_ids:
+            move_dates, move_geoids = self._move_info[pid]
+            dates.extend(move_dates)
+            geoids.extend(move_geoids)
+
+        ranks = np.repeat(np.arange(len(self._move_ids), dtype=np.int64), counts)
+        days = pd.DatetimeIndex(dates).to_numpy().astype("datetime64[D]").view(np.int64)
+        keys = (ranks << 32) | (days + 2**31)
+        # Stable sort keeps the recorded order of same-day moves
+        order = np.argsort(keys, kind="stable")
+        self._move_keys = keys[order]
+        self._move_geoids = np.array(geoids, dtype=object)[order]
+
     def debug_move_info(self, move_info) -> dict:
         """
         Inspect _move_info contents for debugging.
@@ -155,7 +294,6 @@ class ResidentialHistoryHRS:
             If True, print debug information about the lookup process
         """
         assert len(hhidpn_series) == len(date_series)
-        geoids = []
         # Ensure lookup series is integer-typed (nullable) to match keys
         pid_series_int = pd.to_numeric(hhidpn_series, errors="coerce").astype("Int64")
 
@@ -190,17 +328,28 @@ class ResidentialHistoryHRS:
             if not_found_pids:
                 print(f"  Sample PIDs not found (first 5): {not_found_pids[:5]}")
 
-        for pid, dt in zip(pid_series_int, date_series):
-            if pd.isna(pid):
-                geoids.append(None)
-                continue
-            pid_key = int(pid)
-            if pid_key not in self._move_info:
-                # Person not found in residential history - return NaN
-                geoids.append(None)
-            else:
-                move_dates, move_geoids = self._move_info[pid_key]
-                geoids.append(self._find_geoid_for_date(dt, move_dates, move_geoids))
+        pids = self._move_ids
+
+        # Person rank in the sorted history; -1 for missing or unknown IDs
+        query_ids = pid_series_int.to_numpy(dtype=np.int64, na_value=-1)
+        info = np.iinfo(pids.dtype)
+        fits = (query_ids >= info.min) & (query_ids <= info.max)
+        query_ids = np.where(fits, query_ids, -1).astype(pids.dtype)
+        rank = np.searchsorted(pids, query_ids)
+        in_range = rank < len(pids)
+        found = in_range & fits & ~pid_series_int.isna().to_numpy()
+        found[in_range] &= pids[rank[in_range]] == query_ids[in_range]
+        rank = np.where(found, rank, -1)
+
+        query_days = (
+            pd.to_datetime(pd.Series(date_series))
+            .to_numpy(dtype="datetime64[ns]")
+            .astype("datetime64[D]")
+        )
+        pos = _lookup_move_index(self._move_keys, self._move_starts, rank, query_days)
+
+        geoids = np.full(len(pos), None, dtype=object)
+        geoids[pos >= 0] = self._move_geoids[pos[pos >= 0]]
         return pd.Series(geoids, index=hhidpn_series.index, dtype="string")
 
 
@@ -216,15 +365,21 @@ class HRSInterviewData:
 
     def __init__(
         self,
-        filename: Union[str, Path],
+        filename: Union[str, Path, pd.DataFrame],
         datecol: str = "bcdate",
         move: bool = True,
         residential_hist: Optional[ResidentialHistoryHRS] = None,
         hhidpn: str = "hhidpn",
         geoid_col: str = "LINKCEN2010",
+        chunksize: Optional[int] = None,
     ):
-        self.filename = Path(filename)
-        self.df = read_data(self.filename)
+        if isinstance(filename, pd.DataFrame):
+            # In-memory data: copy so normalization below leaves the caller's frame intact
+            self.filename = None
+            self.df = filename.copy()
+        else:
+            self.filename = Path(filename)
+            self.df = _load_data(self.filename, chunksize)
         self.columns = self.df.columns
         assert datecol in self.columns, f"Date column `{datecol}` not in data!"
 
@@ -248,6 +403,29 @@ class HRSInterviewData:
         if not move and geoid_col in self.columns:
             self.df[geoid_col] = self.df[geoid_col].astype(str).str.zfill(11)
 
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, **kwargs) -> "HRSInterviewData":
+        """
+        Build from an in-memory DataFrame, skipping the file round-trip.
+
+        Keyword arguments are passed to the constructor (e.g., ``datecol``,
+        ``move``, ``residential_hist``).
+        """
+        return cls(df, **kwargs)
+
+    def clone_with_df(self, df: pd.DataFrame) -> "HRSInterviewData":
+        """
+        Return a shallow copy that wraps `df` instead of this instance's data.
+
+        Settings and the residential history are shared by reference and no
+        normalization is re-run, so `df` should already be in the normalized
+        form (e.g., derived from this instance's `df`).
+        """
+        clone = copy.copy(self)
+        clone.df = df
+        clone.columns = df.columns
+        return clone
+
     def get_geoid_based_on_date(self, date_series: pd.Series) -> pd.Series:
         return self.residential_hist.create_geoid_based_on_date(
             self.df[self.hhidpn],
@@ -341,26 +519,26 @@ class HRSContextLinker:
         # Collect all new columns to avoid fragmentation
         new_columns = {}
 
-        # Create date columns for all lags
-        for n in tqdm(n_days, desc="Creating date columns", unit="lag"):
+        # Create date columns for all lags with one broadcast subtraction;
+        # row i of `lagged` holds the dates for lag n_days[i]
+        base_dates = result_df[hrs_data.datecol].to_numpy(dtype="datetime64[ns]")
+        offsets = np.asarray(n_days, dtype="timedelta64[D]").astype("timedelta64[ns]")
+        lagged = base_dates[np.newaxis, :] - offsets[:, np.newaxis]
+        for n, dates in zip(n_days, lagged):
             date_colname = f"{hrs_data.datecol}_{n}day_prior"
-            new_columns[date_colname] = result_df[hrs_data.datecol] - pd.to_timedelta(
-                n, unit="d"
-            )
+            new_columns[date_colname] = pd.Series(dates, index=result_df.index)
 
-        # Create GEOID columns for all lags using the helper method
+        # Create GEOID columns for all lags in one lookup
         if geoid_col is None:
             geoid_col = hrs_data.geoid_col
 
-        for n in tqdm(n_days, desc="Creating GEOID columns", unit="lag"):
-            date_colname = f"{hrs_data.datecol}_{n}day_prior"
+        date_colnames = [f"{hrs_data.datecol}_{n}day_prior" for n in n_days]
+        lag_geoids = HRSContextLinker._compute_geoids_for_lags(
+            hrs_data, [new_columns[c] for c in date_colnames], geoid_col
+        )
+        for date_colname, geoids in zip(date_colnames, lag_geoids):
             n_prior_str = "_".join(date_colname.split("_")[1:])
-            geoid_colname = f"{geoid_col}_{n_prior_str}"
-
-            # Use helper method to compute GEOIDs
-            new_columns[geoid_colname] = HRSContextLinker._compute_geoid_for_date(
-                hrs_data, new_columns[date_colname], geoid_col
-            )
+            new_columns[f"{geoid_col}_{n_prior_str}"] = geoids
 
         # Concatenate all new columns at once to avoid fragmentation
         new_cols_df = pd.DataFrame(new_columns, index=result_df.index)
@@ -389,9 +567,49 @@ class HRSContextLinker:
             # Use the specified static GEOID column directly
             if geoid_col is None:
                 geoid_col = hrs_data.geoid_col
-            geoids = hrs_data.df[geoid_col].astype(str).str.zfill(11)
+            geoids = _zfill_geoids(hrs_data.df[geoid_col])
         return geoids
 
+    @staticmethod
+    def _compute_geoids_for_lags(
+        hrs_data: "HRSInterviewData",
+        date_series_list: List[pd.Series],
+        geoid_col: Optional[str] = None,
+    ) -> List[pd.Series]:
+        """
+        Compute GEOID Series for several lag date Series at once.
+
+        Static GEOIDs are computed once and shared by every lag. With residential
+        history, all (person, date) pairs are stacked into one vectorized lookup,
+        then the result is sliced back into one Series per lag.
+        """
+        if not date_series_list:
+            return []
+
+        if not hrs_data.move:
+            geoids = HRSContextLinker._compute_geoid_for_date(
+                hrs_data, date_series_list[0], geoid_col
+            )
+            return [geoids] * len(date_series_list)
+
+        n_rows = len(hrs_data.df)
+        stacked = hrs_data.residential_hist.create_geoid_based_on_date(
+            pd.concat(
+                [hrs_data.df[hrs_data.hhidpn]] * len(date_series_list),
+                ignore_index=True,
+            ),
+            pd.concat(date_series_list, ignore_index=True),
+        ).array
+
+        return [
+            pd.Series(
+                stacked[i * n_rows : (i + 1) * n_rows],
+                index=hrs_data.df.index,
+                dtype="string",
+            )
+            for i in range(len(date_series_list))
+        ]
+
     @staticmethod
     def make_geoid_day_prior(
         hrs_data: "HRSInterviewData",
@@ -528,9 +746,9 @@ class HRSContextLinker:
         n_day_colname = f"{hrs_data.datecol}_{n}day_prior"
         n_day_geoid_colname = f"{geoid_col}_{n}day_prior"
 
-        hrs_copy = precomputed_lag_df[
-            [id_col, n_day_colname, n_day_geoid_colname]
-        ].copy()
+        # Column selection already materialises a new frame and it is never
+        # mutated, so lag workers share precomputed_lag_df without a second copy
+        hrs_copy = precomputed_lag_df[[id_col, n_day_colname, n_day_geoid_colname]]
 
         # If no valid geoid, return empty contextual column
         if hrs_copy[n_day_geoid_colname].isna().all():
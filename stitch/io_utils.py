@@ -14,8 +14,9 @@ Supported formats:
 """
 
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import IO, Any, Dict, Optional, Union
 import inspect
 import pandas as pd
 import numpy as np
@@ -53,6 +54,27 @@ def _filter_kwargs(func: callable, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         return kwargs
 
 
+def _is_file_like(obj: Any) -> bool:
+    """Return True if obj is an open file-like object (e.g., io.BytesIO)."""
+    return hasattr(obj, "read") or hasattr(obj, "write")
+
+
+def _buffer_extension(buffer: IO) -> str:
+    """
+    Get the file extension for a file-like object from its ``name`` attribute.
+
+    In-memory buffers have no path, so the format is taken from ``buffer.name``
+    (e.g., a ``BytesIO`` with ``name = "data.parquet"``).
+    """
+    name = getattr(buffer, "name", None)
+    if not isinstance(name, (str, Path)):
+        raise ValueError(
+            "Cannot detect file format of a file-like object without a `name` "
+            "attribute (e.g., set buffer.name = 'data.parquet')"
+        )
+    return Path(name).suffix.lower().lstrip(".")
+
+
 # Helper: sanitize DataFrame for CSV/Excel/Stata exports
 def _sanitize_for_tabular(input_df: pd.DataFrame, mode: str = "string") -> pd.DataFrame:
     """
@@ -162,7 +184,7 @@ def _sanitize_for_tabular(input_df: pd.DataFrame, mode: str = "string") -> pd.Da
 
 
 def read_data(
-    file_path: Union[str, Path],
+    file_path: Union[str, Path, IO],
     **kwargs: Any,
 ) -> pd.DataFrame:
     """
@@ -172,8 +194,9 @@ def read_data(
 
     Parameters
     ----------
-    file_path : str or Path
-        Path to the file to read.
+    file_path : str, Path, or file-like
+        Path to the file to read. A file-like object (e.g., ``io.BytesIO``) is
+        also accepted; its format is detected from its ``name`` attribute.
     **kwargs : Any
         Additional keyword arguments to pass to the underlying pandas read function.
         Common examples:
@@ -208,13 +231,16 @@ def read_data(
     >>> # Read a Parquet file with specific columns (usecols works here too!)
     >>> df = read_data("data/results.parquet", usecols=["id", "value"])
     """
-    file_path = Path(file_path)
+    if _is_file_like(file_path):
+        ext = _buffer_extension(file_path)
+    else:
+        file_path = Path(file_path)
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
 
-    # Get file extension (lowercase, without dot)
-    ext = file_path.suffix.lower().lstrip(".")
+        # Get file extension (lowercase, without dot)
+        ext = file_path.suffix.lower().lstrip(".")
 
     # Map extension to pandas read function
     if ext == "csv":
@@ -232,15 +258,21 @@ def read_data(
         mapped_kwargs = kwargs.copy()
         if "usecols" in mapped_kwargs and "columns" not in mapped_kwargs:
             mapped_kwargs["columns"] = mapped_kwargs.pop("usecols")
+        # Parquet columns are already typed; apply any requested dtype afterwards
+        dtype = mapped_kwargs.pop("dtype", None)
         filtered_kwargs = _filter_kwargs(pd.read_parquet, mapped_kwargs)
-        return pd.read_parquet(file_path, **filtered_kwargs)
+        df = pd.read_parquet(file_path, **filtered_kwargs)
+        return df.astype(dtype) if dtype is not None else df
     elif ext == "feather":
         # Feather uses 'columns' instead of 'usecols'
         mapped_kwargs = kwargs.copy()
         if "usecols" in mapped_kwargs and "columns" not in mapped_kwargs:
             mapped_kwargs["columns"] = mapped_kwargs.pop("usecols")
+        # Feather columns are already typed; apply any requested dtype afterwards
+        dtype = mapped_kwargs.pop("dtype", None)
         filtered_kwargs = _filter_kwargs(pd.read_feather, mapped_kwargs)
-        return pd.read_feather(file_path, **filtered_kwargs)
+        df = pd.read_feather(file_path, **filtered_kwargs)
+        return df.astype(dtype) if dtype is not None else df
     elif ext in ("xlsx", "xls"):
         filtered_kwargs = _filter_kwargs(pd.read_excel, kwargs)
         return pd.read_excel(file_path, **filtered_kwargs)
@@ -253,7 +285,7 @@ def read_data(
 
 def write_data(
     df: pd.DataFrame,
-    file_path: Union[str, Path],
+    file_path: Union[str, Path, IO],
     **kwargs: Any,
 ) -> None:
     """
@@ -265,8 +297,9 @@ def write_data(
     ----------
     df : pd.DataFrame
         DataFrame to write.
-    file_path : str or Path
-        Path to the output file.
+    file_path : str, Path, or file-like
+        Path to the output file. A file-like object (e.g., ``io.BytesIO``) is
+        also accepted; its format is detected from its ``name`` attribute.
     **kwargs : Any
         Additional keyword arguments to pass to the underlying pandas write function.
         Common examples:
@@ -295,13 +328,16 @@ def write_data(
     >>> # Write to Parquet with compression
     >>> write_data(df, "output/results.parquet", compression="gzip")
     """
-    file_path = Path(file_path)
+    if _is_file_like(file_path):
+        ext = _buffer_extension(file_path)
+    else:
+        file_path = Path(file_path)
 
-    # Create parent directory if it doesn't exist
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create parent directory if it doesn't exist
+        file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Get file extension (lowercase, without dot)
-    ext = file_path.suffix.lower().lstrip(".")
+        # Get file extension (lowercase, without dot)
+        ext = file_path.suffix.lower().lstrip(".")
 
     # Prepare a defensive copy for sanitation across all formats
     out_df = df.copy()
@@ -367,8 +403,13 @@ def get_file_format(file_path: Union[str, Path]) -> str:
     >>> get_file_format("data/file.parquet")
     'parquet'
     """
-    file_path = Path(file_path)
-    ext = file_path.suffix.lower().lstrip(".")
+    return _get_file_format_cached(str(file_path))
+
+
+@lru_cache(maxsize=256)
+def _get_file_format_cached(file_path: str) -> str:
+    """Cached format lookup keyed on the string form of the path."""
+    ext = Path(file_path).suffix.lower().lstrip(".")
 
     if ext == "csv":
         return "csv"
@@ -1,13 +1,95 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Union
 import argparse
+import itertools
+import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from tqdm import tqdm
 from .hrs import HRSInterviewData, HRSContextLinker, ResidentialHistoryHRS
 from .daily_measure import DailyMeasureDataDir
 from .io_utils import write_data
 
 
+# Set to "1" to pin each lag worker thread to its own CPU (Linux only)
+PIN_THREADS_ENV = "STITCH_PIN_THREADS"
+
+# Shared by every pool so workers of different pools take different CPUs
+_PIN_COUNTER = itertools.count()
+
+
+def _pin_worker_thread(cpu_ids: tuple) -> None:
+    """
+    Pool initializer: pin the calling worker thread to its own CPU.
+
+    Workers take CPUs from `cpu_ids` in start order across all pools, so
+    consecutive lag tasks on a worker keep their cache. No-op where thread
+    affinity is unsupported (e.g., macOS) or refused.
+    """
+    try:
+        os.sched_setaffinity(0, {cpu_ids[next(_PIN_COUNTER) % len(cpu_ids)]})
+    except (AttributeError, OSError):
+        pass
+
+
+def _make_pool(max_workers: int, pin_threads: bool = False) -> ThreadPoolExecutor:
+    """
+    Create a lag worker pool with `max_workers` threads.
+
+    Callers own the pool and should use it in a ``with`` block so its threads
+    are shut down. With `pin_threads`, and when the process may run on at
+    least `max_workers` CPUs, each worker is pinned to a distinct one.
+    """
+    initializer, initargs = None, ()
+    if pin_threads and hasattr(os, "sched_getaffinity"):
+        cpu_ids = tuple(sorted(os.sched_getaffinity(0)))
+        if max_workers <= len(cpu_ids):
+            initializer = _pin_worker_thread
+            initargs = (cpu_ids,)
+
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="stitch-lag",
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+# Upper bound on rows per Parquet row group for temporary lag files
+PARQUET_ROW_GROUP_SIZE = 256_000
+
+# Maximum number of lag files waiting to be written in process_multiple_lags_batch
+WRITE_QUEUE_DEPTH = 2
+
+# Number of lag files read ahead of the merge when assembling the final dataset
+LAG_READ_AHEAD = 4
+
+
+def _write_lag_file(out_df: pd.DataFrame, temp_file: Path, file_format: str) -> None:
+    """
+    Write one lag's output to `temp_file`.
+
+    Parquet output is converted to a single-chunk Arrow table and written with
+    bounded row groups and Snappy compression; other formats use write_data.
+    """
+    if file_format != "parquet":
+        write_data(out_df, temp_file, index=False)
+        return
+
+    table = pa.Table.from_pandas(out_df, preserve_index=False).combine_chunks()
+    pq.write_table(
+        table,
+        temp_file,
+        row_group_size=max(1, min(len(out_df), PARQUET_ROW_GROUP_SIZE)),
+        compression="snappy",
+        use_dictionary=True,
+    )
+
+
 def convert_geoid_columns_to_string(
     df: pd.DataFrame, geoid_cols: List[str]
 ) -> pd.DataFrame:
@@ -26,7 +108,9 @@ def convert_geoid_columns_to_string(
     pd.DataFrame
         DataFrame with GEOID columns converted to strings
     """
-    df = df.copy()
+    # Shallow copy: converted columns are replaced wholesale, so the caller's frame
+    # is untouched and the remaining columns are shared instead of reallocated
+    df = df.copy(deep=False)
     for col in geoid_cols:
         if col in df.columns:
             # Convert to string, strip non-digits, zero-pad to 11 digits
@@ -128,6 +212,106 @@ def extract_unique_geoids(
     return all_geoids
 
 
+def _prepare_lag_inputs(
+    hrs_data: HRSInterviewData,
+    contextual_dir: DailyMeasureDataDir,
+    n_days: List[int],
+    geoid_col: str,
+) -> tuple:
+    """
+    Pre-compute lag columns and load the contextual data they need.
+
+    Shared by the batch, fused and parallel lag pipelines.
+
+    Returns
+    -------
+    tuple
+        ``(hrs_with_lags, contextual_df, contextual_date_col,
+        contextual_geoid_col, contextual_data_col)``
+    """
+    # Step 1: Pre-compute all lag columns
+    print(
+        f"📋 Pre-computing date/GEOID columns for lags: {min(n_days)} to {max(n_days)}"
+    )
+    hrs_with_lags = HRSContextLinker.prepare_lag_columns_batch(
+        hrs_data, n_days, geoid_col
+    )
+
+    # Step 2: Extract unique GEOIDs
+    unique_geoids = extract_unique_geoids(hrs_with_lags, geoid_col)
+    print(f"🔍 Extracted {len(unique_geoids)} unique GEOIDs from all lag columns")
+
+    # Step 3: Compute required years and load filtered contextual data
+    max_lag = max(n_days)
+    required_years = compute_required_years(hrs_data, max_lag)
+    available_years = set(contextual_dir.list_years())
+    years_to_load = [str(y) for y in required_years if str(y) in available_years]
+    print(f"📅 Loading years: {years_to_load}")
+
+    # Set filter and preload
+    contextual_dir.geoid_filter = unique_geoids
+    contextual_dir.preload_years(years_to_load)
+
+    # Concatenate all years
+    print(f"🔗 Concatenating filtered contextual data...")
+    contextual_df = pd.concat([contextual_dir[yr].df for yr in years_to_load], axis=0)
+    print(f"  Contextual data shape: {contextual_df.shape}")
+
+    # Extract metadata once to avoid repeated access to contextual_dir
+    first_context = contextual_dir[years_to_load[0]]
+    return (
+        hrs_with_lags,
+        contextual_df,
+        first_context.date_col,
+        first_context.geoid_col,
+        first_context.data_col,
+    )
+
+
+def _write_lag_outputs(
+    lag_outputs, temp_dir: Path, prefix: str, geoid_col: str, file_format: str
+) -> List[Path]:
+    """
+    Write ``(n, out_df)`` pairs to per-lag temp files, overlapping writes.
+
+    Frames are produced lazily by `lag_outputs`, so the next lag is computed
+    while earlier ones are written in the background.
+    """
+    temp_files = []
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        for n, out_df in lag_outputs:
+            # Skip if no valid data
+            if out_df.shape[1] <= 1:
+                continue
+
+            # Convert GEOID columns to strings before saving
+            temp_geoid_cols = [c for c in out_df.columns if geoid_col in c]
+            if temp_geoid_cols:
+                out_df = convert_geoid_columns_to_string(out_df, temp_geoid_cols)
+
+            # Save to temp file
+            filename = f"{prefix}_lag_{n:04d}.{file_format}"
+            temp_file = temp_dir / filename
+
+            # Write in the background while the next lag is merged; keep at most
+            # WRITE_QUEUE_DEPTH writes in flight to bound memory held by queued frames
+            pending.append(
+                io_pool.submit(_write_lag_file, out_df, temp_file, file_format)
+            )
+            if len(pending) > WRITE_QUEUE_DEPTH:
+                pending.popleft().result()
+
+            temp_files.append(temp_file)
+            print(f"    ✓ Queued {temp_file.name}")
+
+        # Wait for outstanding writes (re-raises any write error)
+        for fut in pending:
+            fut.result()
+
+    return temp_files
+
+
 def process_multiple_lags_batch(
     hrs_data: HRSInterviewData,
     contextual_dir: DailyMeasureDataDir,
@@ -181,77 +365,203 @@ def process_multiple_lags_batch(
 
     print(f"\n🔄 Starting batch processing for {len(n_days)} lags...")
 
-    # Step 1: Pre-compute all lag columns
-    print(f"📋 Pre-computing date/GEOID columns for lags: {n_days}")
-    hrs_with_lags = HRSContextLinker.prepare_lag_columns_batch(
-        hrs_data, n_days, geoid_col
+    (
+        hrs_with_lags,
+        contextual_df,
+        contextual_date_col,
+        contextual_geoid_col,
+        contextual_data_col,
+    ) = _prepare_lag_inputs(hrs_data, contextual_dir, n_days, geoid_col)
+
+    # Step 4: Process each lag using pre-computed data, overlapping file writes
+    def merged_lags():
+        for n in tqdm(n_days, desc="Processing lags", unit="lag"):
+            print(f"  Processing lag {n}...")
+            yield n, HRSContextLinker.output_merged_columns(
+                hrs_data,
+                n=n,
+                id_col=id_col,
+                precomputed_lag_df=hrs_with_lags,
+                preloaded_contextual_df=contextual_df,
+                contextual_date_col=contextual_date_col,
+                contextual_geoid_col=contextual_geoid_col,
+                contextual_data_col=contextual_data_col,
+                include_lag_date=include_lag_date,
+                geoid_col=geoid_col,
+            )
+
+    temp_files = _write_lag_outputs(
+        merged_lags(), temp_dir, prefix, geoid_col, file_format
     )
 
-    # Step 2: Extract unique GEOIDs
-    unique_geoids = extract_unique_geoids(hrs_with_lags, geoid_col)
-    print(f"🔍 Extracted {len(unique_geoids)} unique GEOIDs from all lag columns")
+    print(f"✅ Batch processing complete! Generated {len(temp_files)} files\n")
+    return temp_files
 
-    # Step 3: Compute required years and load filtered contextual data
-    max_lag = max(n_days)
-    required_years = compute_required_years(hrs_data, max_lag)
-    available_years = set(contextual_dir.list_years())
-    years_to_load = [str(y) for y in required_years if str(y) in available_years]
-    print(f"📅 Loading years: {years_to_load}")
 
-    # Set filter and preload
-    contextual_dir.geoid_filter = unique_geoids
-    contextual_dir.preload_years(years_to_load)
+def _gather_lag_positions(
+    hrs_with_lags: pd.DataFrame,
+    contextual_df: pd.DataFrame,
+    date_colnames: List[str],
+    geoid_colnames: List[str],
+    contextual_date_col: str,
+    contextual_geoid_col: str,
+) -> Optional[np.ndarray]:
+    """
+    Locate the contextual row for every survey row and lag in one lookup.
 
-    # Concatenate all years
-    print(f"🔗 Concatenating filtered contextual data...")
-    contextual_df = pd.concat([contextual_dir[yr].df for yr in years_to_load], axis=0)
-    print(f"  Contextual data shape: {contextual_df.shape}")
+    The (date, GEOID) keys of all lags are stacked and matched against the
+    contextual keys with a single hash lookup.
 
-    # Extract metadata once to avoid repeated access to contextual_dir
-    first_year = years_to_load[0]
-    first_context = contextual_dir[first_year]
-    contextual_date_col = first_context.date_col
-    contextual_geoid_col = first_context.geoid_col
-    contextual_data_col = first_context.data_col
+    Returns
+    -------
+    np.ndarray or None
+        ``(n_lags, n_rows)`` positions into `contextual_df`, -1 where no row
+        matches, or None when contextual keys are not unique (a left merge
+        would then duplicate survey rows).
+    """
+    contextual_keys = pd.MultiIndex.from_arrays(
+        [contextual_df[contextual_date_col], contextual_df[contextual_geoid_col]]
+    )
+    if not contextual_keys.is_unique:
+        return None
 
-    # Step 4: Process each lag using pre-computed data
-    temp_files = []
-    for n in tqdm(n_days, desc="Processing lags", unit="lag"):
-        print(f"  Processing lag {n}...")
-
-        out_df = HRSContextLinker.output_merged_columns(
-            hrs_data,
-            n=n,
-            id_col=id_col,
-            precomputed_lag_df=hrs_with_lags,
-            preloaded_contextual_df=contextual_df,
-            contextual_date_col=contextual_date_col,
-            contextual_geoid_col=contextual_geoid_col,
-            contextual_data_col=contextual_data_col,
-            include_lag_date=include_lag_date,
-            geoid_col=geoid_col,
-        )
+    lag_keys = pd.MultiIndex.from_arrays(
+        [
+            pd.concat([hrs_with_lags[c] for c in date_colnames], ignore_index=True),
+            pd.concat([hrs_with_lags[c] for c in geoid_colnames], ignore_index=True),
+        ]
+    )
+    positions = contextual_keys.get_indexer(lag_keys)
+    return positions.reshape(len(date_colnames), len(hrs_with_lags))
 
-        # Skip if no valid data
-        if out_df.shape[1] <= 1:
-            continue
 
-        # Convert GEOID columns to strings before saving
-        if geoid_col is None:
-            geoid_col = hrs_data.geoid_col
-        temp_geoid_cols = [c for c in out_df.columns if geoid_col in c]
-        out_df = convert_geoid_columns_to_string(out_df, temp_geoid_cols)
+def process_multiple_lags_fused(
+    hrs_data: HRSInterviewData,
+    contextual_dir: DailyMeasureDataDir,
+    n_days: List[int],
+    id_col: str,
+    temp_dir: Path,
+    prefix: str = "",
+    geoid_col: Optional[str] = None,
+    include_lag_date: bool = False,
+    file_format: str = "parquet",
+) -> List[Path]:
+    """
+    Process multiple lags with one fused lookup instead of one merge per lag.
 
-        # Save to temp file
-        filename = f"{prefix}_lag_{n:04d}.{file_format}"
-        temp_file = temp_dir / filename
+    Same inputs and outputs as process_multiple_lags_batch. The contextual
+    keys are hashed once and the (date, GEOID) keys of every lag are matched
+    in a single pass; each lag's output columns are then gathered by
+    position. Falls back to per-lag merges when the contextual data holds
+    duplicate (date, GEOID) keys, and for lags without any valid GEOID.
 
-        write_data(out_df, temp_file, index=False)
+    Parameters
+    ----------
+    hrs_data : HRSInterviewData
+        HRS interview or epigenetic data object
+    contextual_dir : DailyMeasureDataDir
+        Directory containing contextual daily measure data
+    n_days : List[int]
+        List of lag periods (in days) to process
+    id_col : str
+        Unique identifier column for joining (e.g., "hhidpn")
+    temp_dir : Path
+        Directory to save temporary lag files
+    prefix : str, optional
+        Prefix for output filenames
+    geoid_col : str, optional
+        Name of the GEOID column in HRS data
+    include_lag_date : bool, default False
+        Whether to include lag date columns in output
+    file_format : {"parquet", "feather", "csv"}, default "parquet"
+        File format for temporary output files
 
-        temp_files.append(temp_file)
-        print(f"    ✓ Saved to {temp_file.name}")
+    Returns
+    -------
+    List[Path]
+        List of paths to temporary files created for each lag
+    """
+    if geoid_col is None:
+        geoid_col = hrs_data.geoid_col
 
-    print(f"✅ Batch processing complete! Generated {len(temp_files)} files\n")
+    print(f"\n🔄 Starting fused processing for {len(n_days)} lags...")
+
+    (
+        hrs_with_lags,
+        contextual_df,
+        contextual_date_col,
+        contextual_geoid_col,
+        contextual_data_col,
+    ) = _prepare_lag_inputs(hrs_data, contextual_dir, n_days, geoid_col)
+    if isinstance(contextual_data_col, str):
+        contextual_data_col = [contextual_data_col]
+
+    # Step 4: Match every lag's keys at once; lags without any valid GEOID
+    # keep the per-lag path, which returns their ID-only output
+    fused_lags = [
+        n for n in n_days if hrs_with_lags[f"{geoid_col}_{n}day_prior"].notna().any()
+    ]
+    lag_positions = {}
+    if fused_lags:
+        positions = _gather_lag_positions(
+            hrs_with_lags,
+            contextual_df,
+            [f"{hrs_data.datecol}_{n}day_prior" for n in fused_lags],
+            [f"{geoid_col}_{n}day_prior" for n in fused_lags],
+            contextual_date_col,
+            contextual_geoid_col,
+        )
+        if positions is None:
+            print("⚠️  Duplicate contextual (date, GEOID) keys, merging lag by lag")
+        else:
+            lag_positions = dict(zip(fused_lags, positions))
+
+    # Contextual values as arrays that take() can fill with missing values
+    contextual_values = {
+        col: (
+            contextual_df[col].array
+            if pd.api.types.is_extension_array_dtype(contextual_df[col].dtype)
+            else contextual_df[col].to_numpy()
+        )
+        for col in contextual_data_col
+    }
+    base_df = hrs_with_lags.reset_index(drop=True)
+
+    # Step 5: Gather each lag's columns by position, overlapping file writes
+    def gathered_lags():
+        for n in tqdm(n_days, desc="Processing lags", unit="lag"):
+            n_day_colname = f"{hrs_data.datecol}_{n}day_prior"
+            if n not in lag_positions:
+                yield n, HRSContextLinker.output_merged_columns(
+                    hrs_data,
+                    n=n,
+                    id_col=id_col,
+                    precomputed_lag_df=hrs_with_lags,
+                    preloaded_contextual_df=contextual_df,
+                    contextual_date_col=contextual_date_col,
+                    contextual_geoid_col=contextual_geoid_col,
+                    contextual_data_col=contextual_data_col,
+                    include_lag_date=include_lag_date,
+                    geoid_col=geoid_col,
+                )
+                continue
+
+            out_cols = [id_col]
+            if include_lag_date:
+                out_cols += [n_day_colname, f"{geoid_col}_{n}day_prior"]
+            gathered = {
+                f"{col}_{n_day_colname}": pd.api.extensions.take(
+                    values, lag_positions[n], allow_fill=True
+                )
+                for col, values in contextual_values.items()
+            }
+            yield n, base_df[out_cols].assign(**gathered)
+
+    temp_files = _write_lag_outputs(
+        gathered_lags(), temp_dir, prefix, geoid_col, file_format
+    )
+
+    print(f"✅ Fused processing complete! Generated {len(temp_files)} files\n")
     return temp_files
 
 
@@ -273,6 +583,9 @@ def process_multiple_lags_parallel(
 
     Pre-computes all lag columns and filters contextual data once, then processes
     lags in parallel threads that share the same memory space (avoiding serialization).
+    Setting the ``STITCH_PIN_THREADS=1`` environment variable pins each worker
+    thread to its own CPU. With a single worker, lags are processed in the
+    calling thread instead.
 
     Parameters
     ----------
@@ -296,8 +609,8 @@ def process_multiple_lags_parallel(
         File format for temporary output files
     max_workers : int, optional
         Maximum number of worker threads. If None and auto_memory_limit is True,
-        automatically calculates based on available memory. Otherwise uses default
-        from ThreadPoolExecutor.
+        automatically calculates based on available memory. Otherwise uses the
+        CPU count. Never more than one worker per lag.
     auto_memory_limit : bool, default True
         If True and max_workers is None, automatically calculate max_workers
         based on available system memory to prevent OOM errors. Assumes ~2GB
@@ -308,49 +621,20 @@ def process_multiple_lags_parallel(
     List[Path]
         List of paths to temporary files created for each lag
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    from .hrs import HRSContextLinker
-    import os
+    from concurrent.futures import as_completed
 
     if geoid_col is None:
         geoid_col = hrs_data.geoid_col
 
     print(f"\n🚀 Starting parallel processing for {len(n_days)} lags...")
 
-    # Step 1: Pre-compute all lag columns
-    print(
-        f"📋 Pre-computing date/GEOID columns for lags: {min(n_days)} to {max(n_days)}"
-    )
-    hrs_with_lags = HRSContextLinker.prepare_lag_columns_batch(
-        hrs_data, n_days, geoid_col
-    )
-
-    # Step 2: Extract unique GEOIDs
-    unique_geoids = extract_unique_geoids(hrs_with_lags, geoid_col)
-    print(f"🔍 Extracted {len(unique_geoids)} unique GEOIDs from all lag columns")
-
-    # Step 3: Compute required years and load filtered contextual data
-    max_lag = max(n_days)
-    required_years = compute_required_years(hrs_data, max_lag)
-    available_years = set(contextual_dir.list_years())
-    years_to_load = [str(y) for y in required_years if str(y) in available_years]
-    print(f"📅 Loading years: {years_to_load}")
-
-    # Set filter and preload
-    contextual_dir.geoid_filter = unique_geoids
-    contextual_dir.preload_years(years_to_load)
-
-    # Concatenate all years
-    print(f"🔗 Concatenating filtered contextual data...")
-    contextual_df = pd.concat([contextual_dir[yr].df for yr in years_to_load], axis=0)
-    print(f"  Contextual data shape: {contextual_df.shape}")
-
-    # Extract metadata once to avoid accessing contextual_dir in threads
-    first_year = years_to_load[0]
-    first_context = contextual_dir[first_year]
-    contextual_date_col = first_context.date_col
-    contextual_geoid_col = first_context.geoid_col
-    contextual_data_col = first_context.data_col
+    (
+        hrs_with_lags,
+        contextual_df,
+        contextual_date_col,
+        contextual_geoid_col,
+        contextual_data_col,
+    ) = _prepare_lag_inputs(hrs_data, contextual_dir, n_days, geoid_col)
 
     # Auto-calculate max_workers based on available memory if not specified
     if max_workers is None and auto_memory_limit:
@@ -397,29 +681,48 @@ def process_multiple_lags_parallel(
             print("   Falling back to default max_workers")
             max_workers = None
 
+    # Default to one worker per CPU; idle threads beyond one per lag only add
+    # startup and scheduling overhead
+    max_workers = min(max_workers or os.cpu_count() or 1, len(n_days))
+
+    lag_kwargs = dict(
+        hrs_data=hrs_data,
+        id_col=id_col,
+        temp_dir=temp_dir,
+        prefix=prefix,
+        include_lag_date=include_lag_date,
+        file_format=file_format,
+        geoid_col=geoid_col,
+        precomputed_lag_df=hrs_with_lags,
+        preloaded_contextual_df=contextual_df,
+        contextual_date_col=contextual_date_col,
+        contextual_geoid_col=contextual_geoid_col,
+        contextual_data_col=contextual_data_col,
+    )
+    temp_files = []
+
+    if max_workers == 1:
+        # Step 4: A one-thread pool only adds dispatch overhead; run lags inline
+        print(f"⚡ Processing {len(n_days)} lags in the calling thread...")
+        for n in tqdm(n_days, desc="Processing lags", unit="lag"):
+            try:
+                result = _process_single_lag_internal(n=n, **lag_kwargs)
+                if result is not None:
+                    temp_files.append(result)
+            except Exception as e:
+                print(f"  ❌ Error processing lag {n}: {e}")
+
+        print(f"✅ Parallel processing complete! Generated {len(temp_files)} files\n")
+        return temp_files
+
     # Step 4: Process lags in parallel using threads (shares memory)
     print(f"⚡ Processing {len(n_days)} lags in parallel...")
-    temp_files = []
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    pin_threads = os.environ.get(PIN_THREADS_ENV) == "1"
+    with _make_pool(max_workers, pin_threads=pin_threads) as executor:
         # Submit all tasks
         futures = {
-            executor.submit(
-                _process_single_lag_internal,
-                n=n,
-                hrs_data=hrs_data,
-                id_col=id_col,
-                temp_dir=temp_dir,
-                prefix=prefix,
-                include_lag_date=include_lag_date,
-                file_format=file_format,
-                geoid_col=geoid_col,
-                precomputed_lag_df=hrs_with_lags,
-                preloaded_contextual_df=contextual_df,
-                contextual_date_col=contextual_date_col,
-                contextual_geoid_col=contextual_geoid_col,
-                contextual_data_col=contextual_data_col,
-            ): n
+            executor.submit(_process_single_lag_internal, n=n, **lag_kwargs): n
             for n in n_days
         }
 
@@ -587,12 +890,13 @@ def _process_single_lag_internal(
         if geoid_col is None:
             geoid_col = hrs_data.geoid_col
         temp_geoid_cols = [c for c in out_df.columns if geoid_col in c]
-        out_df = convert_geoid_columns_to_string(out_df, temp_geoid_cols)
+        if temp_geoid_cols:
+            out_df = convert_geoid_columns_to_string(out_df, temp_geoid_cols)
 
         filename = f"{prefix}_lag_{n:04d}.{file_format}"
         temp_file = temp_dir / filename
 
-        write_data(out_df, temp_file, index=False)
+        _write_lag_file(out_df, temp_file, file_format)
 
         return temp_file
 
@@ -740,11 +1044,21 @@ def run_pipeline(args: argparse.Namespace):
     ]
     temp_files.sort(key=lambda f: int(f.stem.split("_lag_")[1]))
 
-    for i, f in enumerate(temp_files):
-        if (i + 1) % 100 == 0:
-            print(f"  Merged {i + 1}/{len(temp_files)} files...")
-        lag_df = pd.read_parquet(f)
-        final_df = final_df.merge(lag_df, on=args.id_col, how="left")
+    # Read upcoming lag files on I/O threads while earlier ones are merged; a
+    # dedicated pool keeps reads off the (possibly pinned) lag compute workers
+    with ThreadPoolExecutor(max_workers=LAG_READ_AHEAD) as io_pool:
+        pending = deque(
+            io_pool.submit(pd.read_parquet, f) for f in temp_files[:LAG_READ_AHEAD]
+        )
+        for i in range(len(temp_files)):
+            if (i + 1) % 100 == 0:
+                print(f"  Merged {i + 1}/{len(temp_files)} files...")
+            if i + LAG_READ_AHEAD < len(temp_files):
+                pending.append(
+                    io_pool.submit(pd.read_parquet, temp_files[i + LAG_READ_AHEAD])
+                )
+            lag_df = pending.popleft().result()
+            final_df = final_df.merge(lag_df, on=args.id_col, how="left")
 
     # Convert GEOID columns to strings before saving
     base_geoid = args.geoid_col
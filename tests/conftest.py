@@ -14,16 +14,27 @@ if sys.platform == "linux" and "DISPLAY" not in os.environ:
 
 import pytest
 from pathlib import Path
+from stitch.daily_measure import DailyMeasureDataDir
 from stitch.hrs import ResidentialHistoryHRS, HRSInterviewData
 from .data_generators import (
     create_residential_history_data,
     create_survey_data,
     get_real_geoids_sample,
+    write_fixture_files,
 )
 import pandas as pd
 import numpy as np
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--strict-verify",
+        action="store_true",
+        default=False,
+        help="Also compare full outputs, not just column hashes, in performance tests.",
+    )
+
+
 @pytest.fixture(scope="session")
 def test_data_dir():
     """Get the test data directory path."""
@@ -46,35 +57,79 @@ def real_geoid_pool(heat_index_dir):
 
 
 @pytest.fixture(scope="session")
-def fake_residential_history_file(tmp_path_factory, real_geoid_pool):
+def shared_test_geoids(real_geoid_pool):
+    """Seeded subset of real GEOIDs shared by survey and contextual fixtures."""
+    rng = np.random.default_rng(0)
+    return rng.choice(
+        real_geoid_pool, size=min(50, len(real_geoid_pool)), replace=False
+    )
+
+
+@pytest.fixture(scope="session")
+def fixture_data_dir(tmp_path_factory):
+    """Single session-wide directory for generated fixture files."""
+    return tmp_path_factory.mktemp("data")
+
+
+@pytest.fixture(scope="session")
+def fake_hrs_files(fixture_data_dir, real_geoid_pool):
     """
-    Create a fake residential history Stata file using real GEOIDs.
+    Create the fake residential history and survey Stata files in one burst.
+
+    Both DataFrames are built first and then written concurrently into the
+    shared session directory.
 
     Returns
     -------
-    Path
-        Path to the generated .dta file
+    dict
+        Mapping of ``"residential_history"`` and ``"survey"`` to .dta paths
     """
     import pandas as pd
 
-    # Get data from standalone generator
-    data_rows = create_residential_history_data(n_people=55, geoid_pool=real_geoid_pool)
-
-    # Convert to DataFrame
-    df = pd.DataFrame(data_rows)
+    # Residential history from standalone generator, using real GEOIDs
+    res_df = pd.DataFrame(
+        create_residential_history_data(n_people=55, geoid_pool=real_geoid_pool)
+    )
 
     # Convert appropriate columns to proper types
-    df["mvyear"] = pd.to_numeric(df["mvyear"], errors="coerce")
-    df["mvmonth"] = pd.to_numeric(df["mvmonth"], errors="coerce")
-    df["year"] = pd.to_numeric(df["year"], errors="coerce")
-    df["trmove_tr"] = df["trmove_tr"].astype(str)
+    res_df["mvyear"] = pd.to_numeric(res_df["mvyear"], errors="coerce")
+    res_df["mvmonth"] = pd.to_numeric(res_df["mvmonth"], errors="coerce")
+    res_df["year"] = pd.to_numeric(res_df["year"], errors="coerce")
+    res_df["trmove_tr"] = res_df["trmove_tr"].astype(str)
+
+    # Survey data from standalone generator, with bcdate as datetime
+    survey_df = pd.DataFrame(create_survey_data(n_people=55))
+    survey_df["bcdate"] = pd.to_datetime(survey_df["bcdate"])
+
+    res_path, survey_path = write_fixture_files(
+        [
+            (
+                res_df,
+                fixture_data_dir / "fake_residential_history.dta",
+                dict(write_index=False, version=117, convert_dates={}),
+            ),
+            (
+                survey_df,
+                fixture_data_dir / "fake_survey_data.dta",
+                dict(write_index=False, version=117, convert_dates={"bcdate": "td"}),
+            ),
+        ]
+    )
 
-    # Save to temporary file
-    tmp_path = tmp_path_factory.mktemp("data")
-    file_path = tmp_path / "fake_residential_history.dta"
-    df.to_stata(file_path, write_index=False)
+    return {"residential_history": res_path, "survey": survey_path}
 
-    return file_path
+
+@pytest.fixture(scope="session")
+def fake_residential_history_file(fake_hrs_files):
+    """
+    Path to the fake residential history Stata file using real GEOIDs.
+
+    Returns
+    -------
+    Path
+        Path to the generated .dta file
+    """
+    return fake_hrs_files["residential_history"]
 
 
 @pytest.fixture(scope="session")
@@ -93,32 +148,16 @@ def residential_history_hrs(fake_residential_history_file):
 
 
 @pytest.fixture(scope="session")
-def fake_survey_file(tmp_path_factory):
+def fake_survey_file(fake_hrs_files):
     """
-    Create a fake survey/interview Stata file.
+    Path to the fake survey/interview Stata file.
 
     Returns
     -------
     Path
         Path to the generated .dta file
     """
-    import pandas as pd
-
-    # Get data from standalone generator
-    data_rows = create_survey_data(n_people=55)
-
-    # Convert to DataFrame
-    df = pd.DataFrame(data_rows)
-
-    # Convert bcdate to datetime
-    df["bcdate"] = pd.to_datetime(df["bcdate"])
-
-    # Save to temporary file
-    tmp_path = tmp_path_factory.mktemp("data")
-    file_path = tmp_path / "fake_survey_data.dta"
-    df.to_stata(file_path, write_index=False)
-
-    return file_path
+    return fake_hrs_files["survey"]
 
 
 @pytest.fixture(scope="session")
@@ -148,46 +187,91 @@ def survey_with_residential_history(survey_data_hrs, residential_history_hrs):
     return survey_data_hrs
 
 
+def _survey_2016_2020_df(real_geoid_pool) -> pd.DataFrame:
+    """Build survey rows with interview dates only in 2016-2020 using real GEOIDs."""
+    from .data_generators import generate_fake_hhidpn, generate_fake_geoids
+
+    n_people = 55
+    # Generate interview dates between 2016-2020 in one vectorized parse
+    iwdates = pd.to_datetime(
+        {
+            "year": np.random.randint(2016, 2021, n_people),
+            "month": np.random.randint(1, 13, n_people),
+            "day": np.random.randint(1, 29, n_people),
+        }
+    )
+    # Static GEOID columns using real GEOIDs, one batched draw for all years
+    geoids = generate_fake_geoids((n_people, 3), real_geoid_pool)
+
+    return pd.DataFrame(
+        {
+            "hhidpn": generate_fake_hhidpn(n_people),
+            "iwdate": iwdates,  # Use iwdate to match step1 script
+            "LINKCEN2010_2010": geoids[:, 0],
+            "LINKCEN2010_2015": geoids[:, 1],
+            "LINKCEN2010_2020": geoids[:, 2],
+            "age": np.random.randint(50, 90, n_people),
+            "gender": np.random.choice(["Male", "Female"], n_people),
+        }
+    )
+
+
 @pytest.fixture
 def survey_data_2016_2020(tmp_path, real_geoid_pool):
     """Create survey data with interview dates only in 2016-2020 using real GEOIDs."""
-    from .data_generators import generate_fake_hhidpn, generate_fake_geoid
-
-    n_people = 55
-    hhidpns = generate_fake_hhidpn(n_people)
-    rows = []
-
-    for hhidpn in hhidpns:
-        # Generate interview date between 2016-2020
-        interview_year = np.random.randint(2016, 2021)
-        interview_month = np.random.randint(1, 13)
-        interview_day = np.random.randint(1, 29)
-
-        iwdate = pd.Timestamp(
-            f"{interview_year}-{interview_month:02d}-{interview_day:02d}"
-        )
-
-        # Create static GEOID columns using real GEOIDs
-        geoid_2010 = generate_fake_geoid(real_geoid_pool)
-        geoid_2015 = generate_fake_geoid(real_geoid_pool)
-        geoid_2020 = generate_fake_geoid(real_geoid_pool)
-
-        rows.append(
-            {
-                "hhidpn": hhidpn,
-                "iwdate": iwdate,  # Use iwdate to match step1 script
-                "LINKCEN2010_2010": geoid_2010,
-                "LINKCEN2010_2015": geoid_2015,
-                "LINKCEN2010_2020": geoid_2020,
-                "age": np.random.randint(50, 90),
-                "gender": np.random.choice(["Male", "Female"]),
-            }
-        )
-
-    df = pd.DataFrame(rows)
+    df = _survey_2016_2020_df(real_geoid_pool)
 
     # Save to temporary Stata file
     file_path = tmp_path / "survey_2016_2020.dta"
-    df.to_stata(file_path, write_index=False)
+    write_fixture_files(
+        [
+            (
+                df,
+                file_path,
+                dict(write_index=False, version=117, convert_dates={"iwdate": "td"}),
+            )
+        ]
+    )
+
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def survey_data_2016_2020_feather(fixture_data_dir, real_geoid_pool):
+    """
+    Session-wide Feather copy of the 2016-2020 survey data.
 
+    Performance tests load the base survey repeatedly; Feather avoids paying
+    the Stata codec on every load.
+    """
+    file_path = fixture_data_dir / "survey_2016_2020.feather"
+    _survey_2016_2020_df(real_geoid_pool).to_feather(
+        file_path, compression="uncompressed"
+    )
     return file_path
+
+
+@pytest.fixture(scope="session")
+def survey_2016_2020_hrs(survey_data_2016_2020_feather, residential_history_hrs):
+    """
+    Session-wide HRSInterviewData for the 2016-2020 survey with residential history.
+
+    Tests that need a modified survey should derive one with
+    `HRSInterviewData.clone_with_df` rather than mutating this instance.
+    """
+    return HRSInterviewData(
+        survey_data_2016_2020_feather,
+        datecol="iwdate",
+        move=True,
+        residential_hist=residential_history_hrs,
+    )
+
+
+@pytest.fixture(scope="session")
+def heat_index_data(heat_index_dir):
+    """Session-wide DailyMeasureDataDir over the heat index test files."""
+    return DailyMeasureDataDir(
+        heat_index_dir,
+        data_col="index",
+        measure_type=None,
+    )
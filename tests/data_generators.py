@@ -6,7 +6,7 @@ importing pandas, to avoid NumPy compatibility issues.
 """
 
 import numpy as np
-from typing import List
+from typing import List, Optional
 from pathlib import Path
 
 
@@ -61,24 +61,54 @@ def get_real_geoids_sample(heat_index_dir: Path, sample_size: int = 500) -> List
     return sampled.tolist()
 
 
-def generate_fake_geoid(geoid_pool: List[str] = None) -> str:
+def generate_fake_geoid(
+    geoid_pool: List[str] = None, rng: Optional[np.random.Generator] = None
+) -> str:
     """
     Generate a realistic 11-digit Census tract GEOID.
 
     If geoid_pool is provided, randomly selects from it.
     Otherwise generates a random GEOID.
+    Draws come from `rng` when given, else from the global np.random state.
     """
+    integers = np.random.randint if rng is None else rng.integers
+    choice = np.random.choice if rng is None else rng.choice
+
     if geoid_pool is not None and len(geoid_pool) > 0:
-        return np.random.choice(geoid_pool)
+        return choice(geoid_pool)
 
     # Format: SSCCCTTTTTT (State-County-Census Tract)
-    state = np.random.randint(1, 57)  # 50 states + DC + territories
-    county = np.random.randint(1, 1000)
-    tract = np.random.randint(1, 10000)
+    state = integers(1, 57)  # 50 states + DC + territories
+    county = integers(1, 1000)
+    tract = integers(1, 10000)
 
     return f"{state:02d}{county:03d}{tract:06d}"
 
 
+def generate_fake_geoids(
+    size, geoid_pool: List[str] = None, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Generate an array of GEOIDs of the given shape in one batched draw.
+
+    Vectorized counterpart of `generate_fake_geoid`: samples from geoid_pool
+    when provided, otherwise builds random 11-digit GEOIDs.
+    """
+    integers = np.random.randint if rng is None else rng.integers
+    choice = np.random.choice if rng is None else rng.choice
+
+    if geoid_pool is not None and len(geoid_pool) > 0:
+        return choice(np.asarray(geoid_pool), size=size)
+
+    # Format: SSCCCTTTTTT (State-County-Census Tract)
+    state = integers(1, 57, size=size)
+    county = integers(1, 1000, size=size)
+    tract = integers(1, 10000, size=size)
+
+    codes = state.astype(np.int64) * 10**9 + county * 10**6 + tract
+    return np.char.zfill(codes.astype(str), 11)
+
+
 def create_residential_history_data(
     n_people: int = 55, geoid_pool: List[str] = None
 ) -> List[dict]:
@@ -224,6 +254,45 @@ def write_csv_file(data: List[dict], filename: str):
             f.write(",".join(values) + "\n")
 
 
+def write_fixture_files(specs: List[tuple], max_workers: int = None) -> List[Path]:
+    """
+    Write several fixture DataFrames to disk concurrently.
+
+    Parameters
+    ----------
+    specs : List[tuple]
+        ``(df, path, write_kwargs)`` tuples. The writer is chosen from the file
+        extension (``.dta`` uses ``DataFrame.to_stata``, ``.parquet`` uses
+        ``DataFrame.to_parquet``, anything else ``DataFrame.to_csv``) and
+        ``write_kwargs`` are passed to it.
+    max_workers : int, optional
+        Maximum number of writer threads (default: one per file).
+
+    Returns
+    -------
+    List[Path]
+        The written paths, in the same order as ``specs``.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _write_one(spec):
+        df, path, write_kwargs = spec
+        path = Path(path)
+        if path.suffix == ".dta":
+            # pyreadstat.write_dta saves ~3 ms per 200-row fixture but is slower
+            # from 20k rows once %td dates are converted, so stay with pandas
+            df.to_stata(path, **write_kwargs)
+        elif path.suffix == ".parquet":
+            df.to_parquet(path, **write_kwargs)
+        else:
+            df.to_csv(path, **write_kwargs)
+        return path
+
+    # Threads avoid pickling DataFrames; serialization and disk writes release the GIL
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(specs))) as executor:
+        return list(executor.map(_write_one, specs))
+
+
 def main():
     """Generate test data files."""
     from pathlib import Path
@@ -5,11 +5,15 @@ This module tests the integration between ResidentialHistoryHRS and HRSInterview
 classes, including the HRSContextLinker functionality.
 """
 
+import copy
+
+import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
 
 from stitch.hrs import ResidentialHistoryHRS, HRSInterviewData, HRSContextLinker
+from stitch.hrs import _zfill_geoids
 from stitch.daily_measure import DailyMeasureDataDir
 
 
@@ -44,15 +48,17 @@ def test_survey_data_integration(survey_data_hrs):
     # Test GEOID formatting
     geoid_cols = [c for c in survey_data_hrs.df.columns if "LINKCEN" in c]
     for col in geoid_cols:
-        geoid_lengths = survey_data_hrs.df[col].astype(str).str.len()
-        assert geoid_lengths.eq(11).all()
+        geoid_lengths = np.char.str_len(survey_data_hrs.df[col].to_numpy(dtype="U"))
+        assert (geoid_lengths == 11).all()
 
 
 def test_combined_data_integration(survey_with_residential_history):
     """Test integration between survey data and residential history."""
     # Test that we can get GEOIDs based on dates
     n_people = len(survey_with_residential_history.df)
-    test_dates = pd.Series([pd.Timestamp("2015-06-15")] * n_people)
+    test_dates = pd.Series(
+        np.full(n_people, np.datetime64("2015-06-15"), dtype="datetime64[ns]")
+    )
 
     result = survey_with_residential_history.get_geoid_based_on_date(test_dates)
 
@@ -115,15 +121,17 @@ def test_data_consistency(residential_history_hrs, survey_data_hrs):
     # They should have the same person IDs
     assert residential_ids == survey_ids
 
+    # Build row-position indexes once instead of masking the full frame per person
+    res_idx = residential_history_hrs.df.groupby("hhidpn", sort=False).indices
+    surv_idx = survey_data_hrs.df.groupby("hhidpn", sort=False).indices
+
     # Test that dates are reasonable relative to move history
     for hhidpn in list(residential_ids)[:5]:  # Test first 5 people
-        person_moves = residential_history_hrs.df[
-            residential_history_hrs.df["hhidpn"] == hhidpn
-        ]
-        person_survey = survey_data_hrs.df[survey_data_hrs.df["hhidpn"] == hhidpn]
+        person_moves = residential_history_hrs.df.iloc[res_idx[hhidpn]]
+        person_survey = survey_data_hrs.df.iloc[surv_idx.get(hhidpn, [])]
 
         if len(person_survey) > 0:
-            interview_date = person_survey["bcdate"].iloc[0]
+            interview_date = person_survey["bcdate"].iat[0]
 
             # Interview date should be after first tract (2010)
             assert interview_date >= pd.Timestamp("2010-01-01")
@@ -155,3 +163,140 @@ def test_edge_cases(residential_history_hrs):
         late_date = dates[0] + pd.Timedelta(days=365)
         result = residential_history_hrs._find_geoid_for_date(late_date, dates, geoids)
         assert result == geoids[0]
+
+
+def test_survey_id_dtype(residential_history_hrs):
+    """Test that survey IDs stay Int64 while the move lookup keys are narrowed."""
+    dates = ["2016-01-01", "2017-01-01"]
+    small = HRSInterviewData.from_dataframe(
+        pd.DataFrame({"hhidpn": [10001010.0, np.nan], "bcdate": dates})
+    )
+    large = HRSInterviewData.from_dataframe(
+        pd.DataFrame({"hhidpn": [10001010, 2**40], "bcdate": dates})
+    )
+
+    assert small.df["hhidpn"].dtype == "Int64"
+    assert small.df["hhidpn"].tolist() == [10001010, pd.NA]
+    assert large.df["hhidpn"].dtype == "Int64"
+    assert residential_history_hrs._move_ids.dtype == np.int32
+
+
+def test_static_geoid_zfill():
+    """Test that static GEOIDs are padded exactly like astype(str).str.zfill(11)."""
+    for geoids in [
+        pd.Series([1234567890, 1234567890, None, 5], dtype="Int64"),
+        pd.Series(["123", "0123", np.nan, "123"], index=[5, 3, 1, 9]),
+        pd.Series([1.5e9, np.nan, 1.5e9]),
+        pd.Series(["123", None, np.nan, None], dtype=object),
+    ]:
+        pd.testing.assert_series_equal(
+            _zfill_geoids(geoids), geoids.astype(str).str.zfill(11)
+        )
+
+
+def test_clone_with_df(survey_with_residential_history):
+    """Test that a clone wraps the new frame and shares the residential history."""
+    subset = survey_with_residential_history.df.iloc[:5]
+    clone = survey_with_residential_history.clone_with_df(subset)
+
+    assert clone.df is subset
+    assert list(clone.columns) == list(subset.columns)
+    assert clone.residential_hist is survey_with_residential_history.residential_hist
+    assert clone.datecol == survey_with_residential_history.datecol
+    assert survey_with_residential_history.df is not subset
+
+
+def test_vectorized_geoid_lookup(residential_history_hrs):
+    """Test that the array-based lookup matches the per-row move search."""
+    move_info = residential_history_hrs._move_info
+    pids, dates = [], []
+    for hhidpn, (move_dates, _) in move_info.items():
+        for dt in move_dates:
+            for offset in (-1, 0, 45):
+                pids.append(hhidpn)
+                dates.append(dt + pd.Timedelta(days=offset))
+    # Unknown and missing IDs have no residence
+    pids += [-1, None, 2**40]
+    dates += [pd.Timestamp("2015-06-01")] * 3
+
+    result = residential_history_hrs.create_geoid_based_on_date(
+        pd.Series(pids, dtype="Int64"), pd.Series(dates)
+    )
+
+    expected = [
+        (
+            residential_history_hrs._find_geoid_for_date(dt, *move_info[pid])
+            if pid in move_info
+            else None
+        )
+        for pid, dt in zip(pids, dates)
+    ]
+    assert result.tolist() == [pd.NA if g is None else g for g in expected]
+
+
+def test_geoid_lookup_empty_history(residential_history_hrs):
+    """Test that a history with no parsed persons yields all-NA GEOIDs."""
+    empty_hist = copy.copy(residential_history_hrs)
+    empty_hist._move_info = {}
+    empty_hist._sort_move_history()
+
+    result = empty_hist.create_geoid_based_on_date(
+        pd.Series([10001010, None], dtype="Int64"),
+        pd.Series([pd.Timestamp("2015-06-01"), pd.NaT]),
+    )
+    assert result.isna().all()
+    assert len(result) == 2
+
+
+@pytest.mark.parametrize("chunksize", [None, 20])
+def test_chunked_loading(
+    fake_residential_history_file,
+    fake_survey_file,
+    residential_history_hrs,
+    survey_data_hrs,
+    chunksize,
+):
+    """Test that streaming Stata files in chunks matches a full-file load."""
+    residential_hist = ResidentialHistoryHRS(
+        fake_residential_history_file, first_tract_mark="999.0", chunksize=chunksize
+    )
+    survey = HRSInterviewData(fake_survey_file, chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(
+        residential_hist.df, residential_history_hrs.df, check_dtype=False
+    )
+    assert (
+        residential_hist._move_info.keys() == residential_history_hrs._move_info.keys()
+    )
+    pd.testing.assert_series_equal(survey.df["bcdate"], survey_data_hrs.df["bcdate"])
+    assert survey.df["hhidpn"].tolist() == survey_data_hrs.df["hhidpn"].tolist()
+
+
+def test_from_dataframe(fake_survey_file):
+    """Test that building from a DataFrame matches loading the same file."""
+    raw = pd.read_stata(fake_survey_file)
+    raw_before = raw.copy()
+
+    survey = HRSInterviewData.from_dataframe(raw)
+
+    assert survey.filename is None
+    pd.testing.assert_frame_equal(survey.df, HRSInterviewData(fake_survey_file).df)
+    # Normalization must not leak into the caller's frame
+    pd.testing.assert_frame_equal(raw, raw_before)
+
+
+def test_geoid_filter_change_clears_cache(heat_index_dir, real_geoid_pool):
+    """Test that changing the GEOID filter drops years loaded under the old one."""
+    heat_data = DailyMeasureDataDir(heat_index_dir, data_col="index")
+    year = heat_data.list_years()[0]
+
+    heat_data.geoid_filter = set(real_geoid_pool[:2])
+    first = heat_data[year]
+    heat_data.geoid_filter = set(real_geoid_pool[:2])
+    assert heat_data[year] is first
+
+    heat_data.geoid_filter = set(real_geoid_pool[2:4])
+    reloaded = heat_data[year]
+    assert reloaded is not first
+    assert len(reloaded.df) > 0
+    assert set(reloaded.df[reloaded.geoid_col]) <= set(real_geoid_pool[2:4])